@@ -33,8 +33,8 @@ def experiment(alg, params, n_epochs, n_iterations, ep_per_run):
     high = [150, 150, np.pi]
     low = [0, 0, -np.pi]
     n_tiles = [5, 5, 6]
-    low = np.array(low, dtype=np.float)
-    high = np.array(high, dtype=np.float)
+    low = np.array(low, dtype=float)
+    high = np.array(high, dtype=float)
     n_tilings = 1
 
     tilings = Tiles.generate(n_tilings=n_tilings, n_tiles=n_tiles, low=low,
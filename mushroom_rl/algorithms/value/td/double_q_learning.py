@@ -1,5 +1,4 @@
 import numpy as np
-from copy import deepcopy
 
 from mushroom_rl.algorithms.value.td import TD
 from mushroom_rl.utils.table import EnsembleTable
@@ -11,12 +10,23 @@ class DoubleQLearning(TD):
     "Double Q-Learning". Hasselt H. V.. 2010.
 
     """
-    def __init__(self, mdp_info, policy, learning_rate):
+    def __init__(self, mdp_info, policy, learning_rate, micro_batch=1):
+        """
+        Constructor.
+
+        Args:
+            micro_batch (int, 1): number of steps to collect before updating
+                the Q-tables with all of them; the tables are updated as if
+                the steps were provided one at a time, but the random numbers
+                are drawn in a different order.
+
+        """
         self.Q = EnsembleTable(2, mdp_info.size)
 
-        super().__init__(mdp_info, policy, self.Q, learning_rate)
+        super().__init__(mdp_info, policy, self.Q, learning_rate,
+                         micro_batch=micro_batch)
 
-        self.alpha = [deepcopy(self.alpha), deepcopy(self.alpha)]
+        self.alpha = [self.alpha.clone(), self.alpha.clone()]
 
         assert len(self.Q) == 2, 'The regressor ensemble must' \
                                  ' have exactly 2 models.'
@@ -24,18 +34,88 @@ class DoubleQLearning(TD):
     def _update(self, state, action, reward, next_state, absorbing):
         approximator_idx = 0 if np.random.uniform() < .5 else 1
 
-        q_current = self.Q[approximator_idx][state, action]
+        q_table = self.Q[approximator_idx].table
+        sa_idx = (int(state[0]), int(action[0]))
+
+        q_current = q_table[sa_idx]
 
         if not absorbing:
-            q_ss = self.Q[approximator_idx][next_state, :]
-            max_q = np.max(q_ss)
-            a_n = np.array(
-                [np.random.choice(np.argwhere(q_ss == max_q).ravel())])
-            q_next = self.Q[1 - approximator_idx][next_state, a_n]
+            s_n = int(next_state[0])
+            q_ss = q_table[s_n]
+            a_n = np.random.choice(np.flatnonzero(q_ss == q_ss.max()))
+            q_next = self.Q[1 - approximator_idx].table[s_n, a_n]
         else:
             q_next = 0.
 
-        q = q_current + self.alpha[approximator_idx](state, action) * (
-            reward + self.mdp_info.gamma * q_next - q_current)
+        alpha = self.alpha[approximator_idx](state, action)
+
+        q_table[sa_idx] = q_current + alpha * (
+            reward + self._gamma * q_next - q_current)
+
+    def _batch_update(self, state, action, reward, next_state, absorbing):
+        if len(reward) == 1:
+            self._update(state[0], action[0], reward[0], next_state[0],
+                         absorbing[0])
+            return
+
+        approximator_idx = (np.random.uniform(size=len(reward)) >= .5)
+
+        for b in self._independent_slices(state, action, next_state):
+            self._slice_update(state[b], action[b], reward[b], next_state[b],
+                               absorbing[b], approximator_idx[b])
+
+    def _slice_update(self, state, action, reward, next_state, absorbing,
+                      approximator_idx):
+        """
+        Update the two tables with a slice of samples that can be applied at
+        once.
+
+        Args:
+            state (np.ndarray): states;
+            action (np.ndarray): actions;
+            reward (np.ndarray): rewards;
+            next_state (np.ndarray): next states;
+            absorbing (np.ndarray): absorbing flags;
+            approximator_idx (np.ndarray): whether each sample updates the
+                second table.
+
+        """
+        # Each sample updates one of the two tables, but the values of both
+        # are needed for the targets, so all of them are computed before
+        # writing any table.
+        updates = list()
+        for i, mask in enumerate([~approximator_idx, approximator_idx]):
+            if np.any(mask):
+                q_current = self.Q[i][state[mask], action[mask]]
+                q_next = self._next_q(next_state[mask], i)
+
+                alpha = self.alpha[i](state[mask], action[mask])
+
+                q = self._td_update(q_current, alpha, reward[mask],
+                                    self._gamma, q_next, absorbing[mask])
+                updates.append((i, mask, q))
+
+        for i, mask, q in updates:
+            self.Q[i][state[mask], action[mask]] = q
+
+    def _next_q(self, next_state, approximator_idx):
+        """
+        Args:
+            next_state (np.ndarray): the states where next action has to be
+                evaluated;
+            approximator_idx (int): the index of the table used to select the
+                greedy action.
+
+        Returns:
+            The action-values, estimated with the other table, of the greedy
+            action in each state of ``next_state``. Ties are broken randomly.
+
+        """
+        q_ss = self.Q[approximator_idx][next_state, :]
+        max_q = np.max(q_ss, axis=1, keepdims=True)
+
+        ties = q_ss == max_q
+        choice = np.random.randint(np.sum(ties, axis=1))
+        a_n = np.argmax(np.cumsum(ties, axis=1) > choice[:, None], axis=1)
 
-        self.Q[approximator_idx][state, action] = q
+        return self.Q[1 - approximator_idx][next_state, a_n[:, None]]
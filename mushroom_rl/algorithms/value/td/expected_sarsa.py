@@ -22,4 +22,4 @@ class ExpectedSARSA(TD):
             q_next = 0.
 
         self.Q[state, action] = q_current + self.alpha(state, action) * (
-            reward + self.mdp_info.gamma * q_next - q_current)
+            reward + self._gamma * q_next - q_current)
@@ -10,15 +10,53 @@ class QLearning(TD):
     "Learning from Delayed Rewards". Watkins C.J.C.H.. 1989.
 
     """
-    def __init__(self, mdp_info, policy, learning_rate):
+    def __init__(self, mdp_info, policy, learning_rate, micro_batch=1):
+        """
+        Constructor.
+
+        Args:
+            micro_batch (int, 1): number of steps to collect before updating
+                the Q-table with all of them; the Q-table is the same as if
+                the steps were provided one at a time.
+
+        """
         self.Q = Table(mdp_info.size)
 
-        super().__init__(mdp_info, policy, self.Q, learning_rate)
+        super().__init__(mdp_info, policy, self.Q, learning_rate,
+                         micro_batch=micro_batch)
+
+    def _batch_update(self, state, action, reward, next_state, absorbing):
+        Q = self.Q
+
+        for b in self._independent_slices(state, action, next_state):
+            q_current = Q[state[b], action[b]]
+            q_next = self._next_q(next_state[b])
+
+            alpha = self.alpha(state[b], action[b])
+
+            Q[state[b], action[b]] = self._td_update(
+                q_current, alpha, reward[b], self._gamma, q_next, absorbing[b])
 
     def _update(self, state, action, reward, next_state, absorbing):
-        q_current = self.Q[state, action]
+        q_table = self.Q.table
+        sa_idx = (int(state[0]), int(action[0]))
+
+        q_current = q_table[sa_idx]
+        q_next = q_table[int(next_state[0])].max() if not absorbing else 0.
+
+        alpha = self.alpha(state, action)
+
+        q_table[sa_idx] = q_current + alpha * (
+            reward + self._gamma * q_next - q_current)
+
+    def _next_q(self, next_state):
+        """
+        Args:
+            next_state (np.ndarray): the states where next action has to be
+                evaluated.
 
-        q_next = np.max(self.Q[next_state, :]) if not absorbing else 0.
+        Returns:
+            The maximum action-value in each state of ``next_state``.
 
-        self.Q[state, action] = q_current + self.alpha(state, action) * (
-            reward + self.mdp_info.gamma * q_next - q_current)
+        """
+        return np.max(self.Q[next_state, :], axis=-1)
@@ -56,7 +56,7 @@ class RQLearning(TD):
                 state, action])
 
         self.Q[state, action] = self.R_tilde[
-            state, action] + self.mdp_info.gamma * self.Q_tilde[state, action]
+            state, action] + self._gamma * self.Q_tilde[state, action]
 
     def _next_q(self, next_state):
         """
@@ -18,4 +18,4 @@ class SARSA(TD):
         q_next = self.Q[next_state, self.next_action] if not absorbing else 0.
 
         self.Q[state, action] = q_current + self.alpha(state, action) * (
-            reward + self.mdp_info.gamma * q_next - q_current)
+            reward + self._gamma * q_next - q_current)
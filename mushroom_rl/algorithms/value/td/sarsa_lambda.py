@@ -30,11 +30,11 @@ class SARSALambda(TD):
         self.next_action = self.draw_action(next_state)
         q_next = self.Q[next_state, self.next_action] if not absorbing else 0.
 
-        delta = reward + self.mdp_info.gamma * q_next - q_current
+        delta = reward + self._gamma * q_next - q_current
         self.e.update(state, action)
 
         self.Q.table += self.alpha(state, action) * delta * self.e.table
-        self.e.table *= self.mdp_info.gamma * self._lambda
+        self.e.table *= self._gamma * self._lambda
 
     def episode_start(self):
         self.e.reset()
@@ -33,7 +33,7 @@ class SARSALambdaContinuous(TD):
 
         alpha = self.alpha(state, action)
 
-        self.e = self.mdp_info.gamma * self._lambda * self.e + self.Q.diff(
+        self.e = self._gamma * self._lambda * self.e + self.Q.diff(
             phi_state, action)
 
         self.next_action = self.draw_action(next_state)
@@ -41,7 +41,7 @@ class SARSALambdaContinuous(TD):
         q_next = self.Q.predict(phi_next_state,
                                 self.next_action) if not absorbing else 0.
 
-        delta = reward + self.mdp_info.gamma * q_next - q_current
+        delta = reward + self._gamma * q_next - q_current
 
         theta = self.Q.get_weights()
         theta += alpha * delta * self.e
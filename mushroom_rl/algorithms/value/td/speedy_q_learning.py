@@ -11,24 +11,46 @@ class SpeedyQLearning(TD):
     "Speedy Q-Learning". Ghavamzadeh et. al.. 2011.
 
     """
-    def __init__(self, mdp_info, policy, learning_rate):
+    def __init__(self, mdp_info, policy, learning_rate, micro_batch=1):
+        """
+        Constructor.
+
+        Args:
+            micro_batch (int, 1): number of steps to collect before updating
+                the Q-table with them, one at a time.
+
+        """
         self.Q = Table(mdp_info.size)
         self.old_q = deepcopy(self.Q)
 
-        super().__init__(mdp_info, policy, self.Q, learning_rate)
+        super().__init__(mdp_info, policy, self.Q, learning_rate,
+                         micro_batch=micro_batch)
+
+    def _batch_update(self, state, action, reward, next_state, absorbing):
+        # The update of each step needs the Q-table before the previous step,
+        # so the samples are processed one at a time
+        for i in range(len(reward)):
+            self._update(state[i], action[i], reward[i], next_state[i],
+                         absorbing[i])
 
     def _update(self, state, action, reward, next_state, absorbing):
-        old_q = deepcopy(self.Q)
+        q_table = self.Q.table
+        old_table = self.old_q.table
+        sa_idx = (int(state[0]), int(action[0]))
 
-        max_q_cur = np.max(self.Q[next_state, :]) if not absorbing else 0.
-        max_q_old = np.max(self.old_q[next_state, :]) if not absorbing else 0.
+        if absorbing:
+            max_q_cur = max_q_old = 0.
+        else:
+            s_n = int(next_state[0])
+            max_q_cur = q_table[s_n].max()
+            max_q_old = old_table[s_n].max()
 
-        target_cur = reward + self.mdp_info.gamma * max_q_cur
-        target_old = reward + self.mdp_info.gamma * max_q_old
+        np.copyto(old_table, q_table)
 
-        alpha = self.alpha(state, action)
-        q_cur = self.Q[state, action]
-        self.Q[state, action] = q_cur + alpha * (target_old - q_cur) + (
-            1. - alpha) * (target_cur - target_old)
+        target_old = reward + self._gamma * max_q_old
+        delta = self._gamma * (max_q_cur - max_q_old)
 
-        self.old_q = old_q
+        alpha = self.alpha(state, action)
+        q_cur = q_table[sa_idx]
+        q_table[sa_idx] = q_cur + alpha * (target_old - q_cur) + (
+            1. - alpha) * delta
@@ -1,6 +1,7 @@
 import numpy as np
 
 from mushroom_rl.algorithms.agent import Agent
+from mushroom_rl.utils.spaces import Discrete
 
 
 class TD(Agent):
@@ -9,51 +10,212 @@ class TD(Agent):
 
     """
     def __init__(self, mdp_info, policy, approximator, learning_rate,
-                 features=None):
+                 features=None, micro_batch=1):
         """
         Constructor.
 
         Args:
             approximator (object): the approximator to use to fit the
                Q-function;
-            learning_rate (Parameter): the learning rate.
+            learning_rate (Parameter): the learning rate. Algorithms updating
+                the Q-function on batches call it with the arrays of states
+                and actions of the batch, and expect the learning rate of each
+                sample;
+            micro_batch (int, 1): number of steps to collect before updating
+                the Q-function with all of them. Algorithms updating the
+                Q-function on batches apply the steps in the order they were
+                collected, so that each step sees the updates of the previous
+                ones.
 
         """
         self.alpha = learning_rate
 
+        self._micro_batch = micro_batch
+        self._buffer = list()
+        self._samples = None
+
         policy.set_q(approximator)
         self.approximator = approximator
 
         super().__init__(mdp_info, policy, features)
 
+        self._gamma = mdp_info.gamma
+
     def fit(self, dataset):
-        assert len(dataset) == 1
+        if len(dataset) == 1 and self._micro_batch == 1:
+            # A single step is applied directly, without building the batch
+            self._update(*dataset[0][:5])
+        else:
+            self._buffer += dataset
 
-        state, action, reward, next_state, absorbing = self._parse(dataset)
-        self._update(state, action, reward, next_state, absorbing)
+            if len(self._buffer) >= self._micro_batch:
+                self.flush()
 
-    @staticmethod
-    def _parse(dataset):
+    def flush(self):
+        """
+        Update the Q-function with the steps collected since the last update,
+        if any.
+
+        """
+        if len(self._buffer) > 0:
+            state, action, reward, next_state, absorbing = self._parse(
+                self._buffer)
+            self._buffer = list()
+
+            self._batch_update(state, action, reward, next_state, absorbing)
+
+    def stop(self):
+        self.flush()
+
+    def _parse(self, dataset):
         """
-        Utility to parse the dataset that is supposed to contain only a sample.
+        Utility to parse the dataset stacking each component of the samples in
+        a single array. The arrays are views of buffers allocated once and
+        reused, with the same size, for all the following calls.
 
         Args:
-            dataset (list): the current episode step.
+            dataset (list): the steps to use to fit the agent.
 
         Returns:
-            A tuple containing state, action, reward, next state, absorbing and
-            last flag.
+            A tuple containing the arrays of states, actions, rewards, next
+            states and absorbing flags.
 
         """
-        sample = dataset[0]
-        state = sample[0]
-        action = sample[1]
-        reward = sample[2]
-        next_state = sample[3]
-        absorbing = sample[4]
+        n_samples = len(dataset)
+
+        if self._samples is None or len(self._samples[2]) < n_samples:
+            self._samples = self._allocate_samples(
+                dataset[0], max(n_samples, self._micro_batch))
+
+        state, action, reward, next_state, absorbing = [
+            x[:n_samples] for x in self._samples]
+
+        for i, sample in enumerate(dataset):
+            state[i] = sample[0]
+            action[i] = sample[1]
+            reward[i] = sample[2]
+            next_state[i] = sample[3]
+            absorbing[i] = sample[4]
 
         return state, action, reward, next_state, absorbing
 
+    def _allocate_samples(self, sample, n_samples):
+        """
+        Allocate the buffers used to parse the dataset. The type of states and
+        actions is integer for discrete spaces and float otherwise, so that
+        no sample is truncated to the type of the first one.
+
+        Args:
+            sample (tuple): a step used to infer the shape of states and
+                actions;
+            n_samples (int): the number of samples of each buffer.
+
+        Returns:
+            A tuple containing the buffers of states, actions, rewards, next
+            states and absorbing flags.
+
+        """
+        state_shape = np.shape(sample[0])
+        action_shape = np.shape(sample[1])
+        state_dtype = self._space_dtype(self.mdp_info.observation_space)
+        action_dtype = self._space_dtype(self.mdp_info.action_space)
+
+        return (np.empty((n_samples,) + state_shape, dtype=state_dtype),
+                np.empty((n_samples,) + action_shape, dtype=action_dtype),
+                np.empty(n_samples),
+                np.empty((n_samples,) + state_shape, dtype=state_dtype),
+                np.empty(n_samples, dtype=bool))
+
+    @staticmethod
+    def _space_dtype(space):
+        return int if isinstance(space, Discrete) else float
+
+    def _batch_update(self, state, action, reward, next_state, absorbing):
+        """
+        Update the Q-table using a batch of samples. By default, only a single
+        sample is accepted and it is processed with ``_update``, as on-policy
+        algorithms draw the next action during the update; algorithms that
+        can update the Q-table with a batch of samples override this method.
+
+        Args:
+            state (np.ndarray): states;
+            action (np.ndarray): actions;
+            reward (np.ndarray): rewards;
+            next_state (np.ndarray): next states;
+            absorbing (np.ndarray): absorbing flags.
+
+        """
+        assert len(reward) == 1
+
+        self._update(state[0], action[0], reward[0], next_state[0],
+                     absorbing[0])
+
+    @staticmethod
+    def _independent_slices(state, action, next_state):
+        """
+        Split a batch of samples in consecutive slices such that no sample
+        reads an action-value written by a previous sample of the same slice,
+        i.e. the state-action pairs of a slice are distinct and no next state
+        is the state of a previous sample of the slice. Updating the Q-table on
+        each slice at once gives the same result as updating it one sample at
+        a time.
+
+        Args:
+            state (np.ndarray): states;
+            action (np.ndarray): actions;
+            next_state (np.ndarray): next states.
+
+        Returns:
+            The list of slices of the batch.
+
+        """
+        s = state[:, 0]
+        a = action[:, 0]
+        s_n = next_state[:, 0]
+
+        # depends[i, j] is True if the sample i reads an action-value written
+        # by the previous sample j
+        depends = ((s[:, None] == s) & (a[:, None] == a)) | (s_n[:, None] == s)
+        depends = np.tril(depends, -1)
+
+        n_samples = len(s)
+        slices = list()
+        start = 0
+        while start < n_samples:
+            blocked = np.flatnonzero(depends[start + 1:, start:].any(axis=1))
+            stop = start + 1 + blocked[0] if len(blocked) > 0 else n_samples
+            slices.append(slice(start, stop))
+            start = stop
+
+        return slices
+
+    @staticmethod
+    def _td_update(q_current, alpha, reward, gamma, q_next, absorbing):
+        """
+        Compute the updated action-values of a batch of samples, overwriting
+        ``q_next`` to avoid the allocation of temporary arrays.
+
+        Args:
+            q_current (np.ndarray): current action-values;
+            alpha (np.ndarray): learning rates;
+            reward (np.ndarray): rewards;
+            gamma (float): discount factor;
+            q_next (np.ndarray): next state values;
+            absorbing (np.ndarray): absorbing flags.
+
+        Returns:
+            The updated action-values.
+
+        """
+        q_next *= gamma
+        q_next *= ~absorbing
+        q_next += reward
+        q_next -= q_current
+        q_next *= alpha
+        q_next += q_current
+
+        return q_next
+
     def _update(self, state, action, reward, next_state, absorbing):
         """
         Update the Q-table.
@@ -43,15 +43,15 @@ class TrueOnlineSARSALambda(TD):
         alpha = self.alpha(state, action)
 
         e_phi = self.e.dot(phi_state_action)
-        self.e = self.mdp_info.gamma * self._lambda * self.e + alpha * (
-            1. - self.mdp_info.gamma * self._lambda * e_phi) * phi_state_action
+        self.e = self._gamma * self._lambda * self.e + alpha * (
+            1. - self._gamma * self._lambda * e_phi) * phi_state_action
 
         self.next_action = self.draw_action(next_state)
         phi_next_state = self.phi(next_state)
         q_next = self.Q.predict(phi_next_state,
                                 self.next_action) if not absorbing else 0.
 
-        delta = reward + self.mdp_info.gamma * q_next - self._q_old
+        delta = reward + self._gamma * q_next - self._q_old
 
         theta = self.Q.get_weights()
         theta += delta * self.e + alpha * (
@@ -1,4 +1,5 @@
 import numpy as np
+from scipy.special import ndtr
 
 from mushroom_rl.algorithms.value.td import TD
 from mushroom_rl.utils.table import Table
@@ -12,55 +13,58 @@ class WeightedQLearning(TD):
 
     """
     def __init__(self, mdp_info, policy, learning_rate, sampling=True,
-                 precision=1000):
+                 precision=1000, micro_batch=1):
         """
         Constructor.
 
         Args:
-            sampling (bool, True): use the approximated version to speed up
-                the computation;
-            precision (int, 1000): number of samples to use in the approximated
-                version.
+            sampling (bool, True): whether to estimate the weights by sampling
+                from the distributions of the action-values or to use Clark's
+                closed-form approximation of the maximum of Gaussian variables;
+            precision (int, 1000): number of samples to use in the sampling
+                version;
+            micro_batch (int, 1): number of steps to collect before updating
+                the Q-table with all of them.
 
         """
         self.Q = Table(mdp_info.size)
         self._sampling = sampling
         self._precision = precision
 
-        super().__init__(mdp_info, policy, self.Q, learning_rate)
+        super().__init__(mdp_info, policy, self.Q, learning_rate,
+                         micro_batch=micro_batch)
 
-        self._n_updates = Table(mdp_info.size)
-        self._sigma = Table(mdp_info.size, initial_value=1e10)
-        self._Q = Table(mdp_info.size)
-        self._Q2 = Table(mdp_info.size)
-        self._weights_var = Table(mdp_info.size)
+        self._n_updates = Table(mdp_info.size, dtype=np.int32)
+        self._sigma = Table(mdp_info.size, initial_value=1e10,
+                            dtype=np.float32)
+        self._Q = Table(mdp_info.size, dtype=np.float32)
+        self._Q2 = Table(mdp_info.size, dtype=np.float32)
+        self._weights_var = Table(mdp_info.size, dtype=np.float32)
+
+        self._n_actions = self.Q.shape[-1]
+        self._sampling_shape = (self._precision, self._n_actions)
+
+    def _batch_update(self, state, action, reward, next_state, absorbing):
+        for i in range(len(reward)):
+            self._update(state[i], action[i], reward[i], next_state[i],
+                         absorbing[i])
 
     def _update(self, state, action, reward, next_state, absorbing):
-        q_current = self.Q[state, action]
+        q_table = self.Q.table
+        sa_idx = (int(state[0]), int(action[0]))
+
+        q_current = q_table[sa_idx]
         q_next = self._next_q(next_state) if not absorbing else 0.
 
-        target = reward + self.mdp_info.gamma * q_next
+        target = reward + self._gamma * q_next
 
         alpha = self.alpha(state, action)
 
-        self.Q[state, action] = q_current + alpha * (target - q_current)
+        q_table[sa_idx] = q_current + alpha * (target - q_current)
 
-        self._n_updates[state, action] += 1
-
-        self._Q[state, action] += (
-            target - self._Q[state, action]) / self._n_updates[state, action]
-        self._Q2[state, action] += (target ** 2. - self._Q2[
-            state, action]) / self._n_updates[state, action]
-        self._weights_var[state, action] = (
-            1 - alpha) ** 2. * self._weights_var[state, action] + alpha ** 2.
-
-        if self._n_updates[state, action] > 1:
-            var = self._n_updates[state, action] * (
-                self._Q2[state, action] - self._Q[state, action] ** 2.) / (
-                self._n_updates[state, action] - 1.)
-            var_estimator = var * self._weights_var[state, action]
-            var_estimator = np.maximum(var_estimator, 1e-10)
-            self._sigma[state, action] = np.sqrt(var_estimator)
+        _update_statistics(self._n_updates.table, self._Q.table,
+                           self._Q2.table, self._weights_var.table,
+                           self._sigma.table, sa_idx, target, alpha)
 
     def _next_q(self, next_state):
         """
@@ -72,22 +76,92 @@ class WeightedQLearning(TD):
             The weighted estimator value in ``next_state``.
 
         """
-        means = self.Q[next_state, :]
-        sigmas = np.zeros(self.Q.shape[-1])
+        s_idx = int(next_state[0])
 
-        for a in range(sigmas.size):
-            sigmas[a] = self._sigma[next_state, np.array([a])]
+        means = self.Q.table[s_idx]
+        sigmas = self._sigma.table[s_idx]
 
         if self._sampling:
-            samples = np.random.normal(np.repeat([means], self._precision, 0),
-                                       np.repeat([sigmas], self._precision, 0))
+            samples = np.random.standard_normal(self._sampling_shape)
+            samples *= sigmas
+            samples += means
             max_idx = np.argmax(samples, axis=1)
-            max_idx, max_count = np.unique(max_idx, return_counts=True)
-            count = np.zeros(means.size)
-            count[max_idx] = max_count
 
-            self._w = count / self._precision
+            self._w = np.bincount(
+                max_idx, minlength=self._n_actions) / self._precision
         else:
-            raise NotImplementedError
+            self._w = _clark_weights(means, sigmas)
 
         return np.dot(self._w, means)
+
+
+def _update_statistics(n_updates, q, q2, weights_var, sigma, idx, target,
+                       alpha):
+    """
+    Update, in place, the running statistics of the target of a state-action
+    pair and the standard deviation of its weighted estimator.
+
+    Args:
+        n_updates (np.ndarray): the number of updates;
+        q (np.ndarray): the mean of the targets;
+        q2 (np.ndarray): the mean of the squared targets;
+        weights_var (np.ndarray): the sum of the squared learning rates;
+        sigma (np.ndarray): the standard deviations;
+        idx (tuple): index of the state-action pair;
+        target (float): the current target;
+        alpha (float): the current learning rate.
+
+    """
+    n_updates[idx] += 1
+    n = n_updates[idx]
+
+    q[idx] += (target - q[idx]) / n
+    q2[idx] += (target ** 2. - q2[idx]) / n
+    weights_var[idx] = (1 - alpha) ** 2. * weights_var[idx] + alpha ** 2.
+
+    if n > 1:
+        # The statistics can be stored in single precision, the variance is
+        # computed in double precision to limit the cancellation error
+        var = n * (float(q2[idx]) - float(q[idx]) ** 2.) / (n - 1.)
+        var_estimator = max(var * float(weights_var[idx]), 1e-10)
+        sigma[idx] = np.sqrt(var_estimator)
+
+
+def _clark_weights(means, sigmas):
+    """
+    Approximate the probability of each Gaussian variable of being the maximum,
+    iteratively reducing the running maximum and the next variable to a single
+    Gaussian variable with Clark's formulas.
+    "The Greatest of a Finite Set of Random Variables". Clark C. E.. 1961.
+
+    Args:
+        means (np.ndarray): the means of the variables;
+        sigmas (np.ndarray): the standard deviations of the variables.
+
+    Returns:
+        The probability of each variable of being the maximum.
+
+    """
+    w = np.zeros(means.size)
+    w[0] = 1.
+
+    m = means[0]
+    s = sigmas[0]
+    for a in range(1, means.size):
+        theta = np.sqrt(s ** 2. + sigmas[a] ** 2.)
+        beta = (m - means[a]) / theta
+        p = ndtr(beta)
+        phi = np.exp(-beta ** 2. / 2.) / np.sqrt(2. * np.pi)
+
+        m_max = m * p + means[a] * (1. - p) + theta * phi
+        m2_max = (m ** 2. + s ** 2.) * p + (
+            means[a] ** 2. + sigmas[a] ** 2.) * (1. - p) + (
+            m + means[a]) * theta * phi
+
+        m = m_max
+        s = np.sqrt(max(m2_max - m_max ** 2., 0.))
+
+        w *= p
+        w[a] = 1. - p
+
+    return w
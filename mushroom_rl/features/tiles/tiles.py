@@ -85,8 +85,8 @@ class Tiles:
         """
         assert len(n_tiles) == len(low) == len(high)
 
-        low = np.array(low, dtype=np.float)
-        high = np.array(high, dtype=np.float)
+        low = np.array(low, dtype=float)
+        high = np.array(high, dtype=float)
 
         tilings = list()
 
@@ -1,3 +1,5 @@
+from copy import copy
+
 from mushroom_rl.utils.table import Table
 import numpy as np
 
@@ -34,13 +36,24 @@ class Parameter(object):
         Update and return the parameter in the provided index.
 
         Args:
-             *idx (list): index of the parameter to return.
+             *idx (list): index of the parameter to return. It can also be a
+                batch of indices.
 
         Returns:
-            The updated parameter in the provided index.
+            The updated parameter in the provided index, or in each index of
+            the batch.
 
         """
         if self._n_updates.table.size == 1:
+            if idx and isinstance(idx[0], np.ndarray) and idx[0].ndim == 2:
+                # A single parameter is updated once for each sample of the
+                # batch, as if the samples were provided one at a time
+                n_updates = self._n_updates.table[0] + np.arange(
+                    1, len(idx[0]) + 1)
+                self._n_updates.table[0] = n_updates[-1]
+
+                return self._clip(self._schedule(n_updates))
+
             idx = list()
 
         self.update(*idx, **kwargs)
@@ -60,10 +73,18 @@ class Parameter(object):
         """
         new_value = self._compute(*idx, **kwargs)
 
+        return self._clip(new_value)
+
+    def _clip(self, value):
+        """
+        Returns:
+            The provided value clipped to the range of the parameter.
+
+        """
         if self._min_value is None and self._max_value is None:
-            return new_value
+            return value
         else:
-            return np.clip(new_value, self._min_value, self._max_value)
+            return np.clip(value, self._min_value, self._max_value)
 
     def _compute(self, *idx, **kwargs):
         """
@@ -73,16 +94,50 @@ class Parameter(object):
         """
         return self._initial_value
 
+    def _schedule(self, n_updates):
+        """
+        Args:
+            n_updates (np.ndarray): the numbers of visits of the parameter.
+
+        Returns:
+            The value of the parameter after each number of visits.
+
+        """
+        return np.full(len(n_updates), self._initial_value)
+
     def update(self, *idx, **kwargs):
         """
         Updates the number of visit of the parameter in the provided index.
+        The index can also be a batch of indices, e.g. arrays of states and
+        actions with one row for each sample, in which case the number of
+        visits is updated once for each sample.
 
         Args:
             *idx (list): index of the parameter whose number of visits has to be
                 updated.
 
         """
-        self._n_updates[idx] += 1
+        self._n_updates.add(idx, 1)
+
+    def clone(self):
+        """
+        Returns:
+            A new parameter with the same configuration and an independent copy
+            of the tables and arrays storing its state. Any other mutable
+            attribute is shared with the original parameter.
+
+        """
+        parameter = copy(self)
+
+        for name, value in vars(self).items():
+            if isinstance(value, Table):
+                table = copy(value)
+                table.table = value.table.copy()
+                setattr(parameter, name, table)
+            elif isinstance(value, np.ndarray):
+                setattr(parameter, name, value.copy())
+
+        return parameter
 
     @property
     def shape(self):
@@ -109,7 +164,10 @@ class LinearParameter(Parameter):
             super().__init__(value, threshold_value, None, size)
 
     def _compute(self, *idx, **kwargs):
-        return self._coeff * self._n_updates[idx] + self._initial_value
+        return self._schedule(self._n_updates[idx])
+
+    def _schedule(self, n_updates):
+        return self._coeff * n_updates + self._initial_value
 
 
 class ExponentialParameter(Parameter):
@@ -125,7 +183,10 @@ class ExponentialParameter(Parameter):
         super().__init__(value, min_value, max_value, size)
 
     def _compute(self, *idx, **kwargs):
-        n = np.maximum(self._n_updates[idx], 1)
+        return self._schedule(self._n_updates[idx])
+
+    def _schedule(self, n_updates):
+        n = np.maximum(n_updates, 1)
 
         return self._initial_value / n ** self._exp
 
@@ -171,6 +232,9 @@ class AdaptiveParameter(object):
             raise ValueError('Adaptive parameters needs gradient or gradient'
                              'and natural gradient')
 
+    def clone(self):
+        return copy(self)
+
     @property
     def shape(self):
         return None
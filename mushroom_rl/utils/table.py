@@ -19,14 +19,14 @@ class Table:
             dtype ([int, float], None): the dtype of the table array.
 
         """
-        self.table = np.ones(shape, dtype=dtype) * initial_value
+        dtype = float if dtype is None else dtype
+        self.table = np.full(shape, initial_value, dtype=dtype)
 
     def __getitem__(self, args):
         if self.table.size == 1:
             return self.table[0]
         else:
-            idx = tuple([
-                a[0] if isinstance(a, np.ndarray) else a for a in args])
+            idx = self._index(args)
 
             return self.table[idx]
 
@@ -34,10 +34,48 @@ class Table:
         if self.table.size == 1:
             self.table[0] = value
         else:
-            idx = tuple([
-                a[0] if isinstance(a, np.ndarray) else a for a in args])
+            idx = self._index(args)
             self.table[idx] = value
 
+    def add(self, args, value):
+        """
+        Add a value to the entries of the table. Differently from
+        ``table[args] += value``, entries repeated in a batch of indices are
+        incremented once for each occurrence.
+
+        Args:
+            args (tuple): the index of the entries to increment;
+            value (float): the value to add.
+
+        """
+        if self.table.size == 1:
+            self.table[0] += value
+        else:
+            idx = self._index(args)
+
+            if any(isinstance(i, np.ndarray) for i in idx):
+                np.add.at(self.table, idx, value)
+            else:
+                self.table[idx] += value
+
+    @staticmethod
+    def _index(args):
+        """
+        Build the index of the table from the provided arguments.
+        One-dimensional arrays index a single entry, while two-dimensional
+        arrays, with one row for each sample, index a batch of entries at once.
+
+        Args:
+            args (tuple): the components of the index.
+
+        Returns:
+            The index to use on the table array.
+
+        """
+        return tuple([
+            (a[0] if a.ndim == 1 else a[:, 0]) if isinstance(a, np.ndarray)
+            else a for a in args])
+
     def fit(self, x, y):
         """
         Args:
@@ -65,21 +103,18 @@ class Table:
             z = [np.expand_dims(z_i, axis=0) for z_i in z]
         state = z[0]
 
-        values = list()
-        if len(z) == 2:
-            action = z[1]
-            for i in range(len(state)):
-                val = self[state[i], action[i]]
-                values.append(val)
+        if self.table.size == 1:
+            values = np.repeat(self.table, len(state))
+        elif len(z) == 2:
+            action = z[1].reshape(len(state), -1)
+            values = self[state, action]
         else:
-            for i in range(len(state)):
-                val = self[state[i], :]
-                values.append(val)
+            values = self[state, :]
 
         if len(values) == 1:
             return values[0]
         else:
-            return np.array(values)
+            return values
 
     @property
     def n_actions(self):
@@ -12,7 +12,7 @@ from mushroom_rl.environments.gym_env import Gym
 from mushroom_rl.features import Features
 from mushroom_rl.features.tiles import Tiles
 from mushroom_rl.policy.td_policy import EpsGreedy
-from mushroom_rl.utils.parameters import Parameter
+from mushroom_rl.utils.parameters import Parameter, ExponentialParameter
 
 
 class Network(nn.Module):
@@ -63,6 +63,70 @@ def test_q_learning():
     assert np.allclose(agent.Q.table, test_q)
 
 
+def test_q_learning_batch():
+    pi, mdp, _ = initialize()
+    agent = QLearning(mdp.info, pi, Parameter(.5))
+
+    core = Core(agent, mdp)
+
+    # Train
+    core.learn(n_steps=100, n_steps_per_fit=10, quiet=True)
+
+    # The same Q-table obtained updating at each step
+    test_q = np.array([[7.82042542, 8.40151978, 7.64961548, 8.82421875],
+                       [8.77587891, 9.921875, 7.29316406, 8.68359375],
+                       [7.7203125, 7.69921875, 4.5, 9.84375],
+                       [0., 0., 0., 0.]])
+
+    assert np.allclose(agent.Q.table, test_q)
+
+    pi, mdp, _ = initialize()
+    agent = QLearning(mdp.info, pi, Parameter(.5), micro_batch=10)
+
+    core = Core(agent, mdp)
+
+    # Train
+    core.learn(n_steps=100, n_steps_per_fit=1, quiet=True)
+
+    assert np.allclose(agent.Q.table, test_q)
+
+    for n_steps_per_fit, micro_batch in [(1, 1), (10, 1), (1, 10)]:
+        pi, mdp, _ = initialize()
+        alpha = ExponentialParameter(1.)
+        agent = QLearning(mdp.info, pi, alpha, micro_batch=micro_batch)
+
+        core = Core(agent, mdp)
+
+        # Train
+        core.learn(n_steps=100, n_steps_per_fit=n_steps_per_fit, quiet=True)
+
+        assert alpha._n_updates.table[0] == 100
+        assert np.isclose(alpha.get_value(), .01)
+
+
+def test_q_learning_batch_repeated_samples():
+    pi, mdp, _ = initialize()
+
+    dataset = list()
+    for s, a, r, s_n in [(0, 1, 1., 1), (0, 1, 1., 1), (1, 3, 0., 0),
+                         (0, 1, 1., 1), (2, 0, -1., 3), (0, 1, 1., 1)]:
+        dataset.append((np.array([s]), np.array([a]), r, np.array([s_n]),
+                        False, False))
+
+    agent_step = QLearning(mdp.info, pi,
+                           ExponentialParameter(1., size=mdp.info.size))
+    for sample in dataset:
+        agent_step.fit([sample])
+
+    agent_batch = QLearning(mdp.info, pi,
+                            ExponentialParameter(1., size=mdp.info.size))
+    agent_batch.fit(dataset)
+
+    assert np.allclose(agent_batch.Q.table, agent_step.Q.table)
+    assert np.array_equal(agent_batch.alpha._n_updates.table,
+                          agent_step.alpha._n_updates.table)
+
+
 def test_double_q_learning():
     pi, mdp, _ = initialize()
     agent = DoubleQLearning(mdp.info, pi, Parameter(.5))
@@ -84,6 +148,35 @@ def test_double_q_learning():
     assert np.allclose(agent.Q[0].table, test_q_0)
     assert np.allclose(agent.Q[1].table, test_q_1)
 
+    alpha = ExponentialParameter(1., size=mdp.info.size)
+    agent = DoubleQLearning(mdp.info, pi, alpha)
+
+    core = Core(agent, mdp)
+
+    # Train
+    core.learn(n_steps=100, n_steps_per_fit=1, quiet=True)
+
+    n_updates_0 = agent.alpha[0]._n_updates.table
+    n_updates_1 = agent.alpha[1]._n_updates.table
+
+    assert n_updates_0.sum() + n_updates_1.sum() == 100
+    assert not np.array_equal(n_updates_0, n_updates_1)
+    assert alpha._n_updates.table.sum() == 0
+
+    # Repeated absorbing samples, each head has to be updated once for each
+    # sample assigned to it
+    agent = DoubleQLearning(mdp.info, pi, Parameter(.5, size=mdp.info.size),
+                            micro_batch=8)
+    for _ in range(8):
+        agent.fit([(np.array([0]), np.array([1]), 1., np.array([1]), True,
+                    True)])
+
+    n_updates = [agent.alpha[i]._n_updates.table[0, 1] for i in range(2)]
+
+    assert sum(n_updates) == 8
+    for i in range(2):
+        assert np.isclose(agent.Q[i].table[0, 1], 1. - .5 ** n_updates[i])
+
 
 def test_weighted_q_learning():
     pi, mdp, _ = initialize()
@@ -101,6 +194,20 @@ def test_weighted_q_learning():
 
     assert np.allclose(agent.Q.table, test_q)
 
+    agent = WeightedQLearning(mdp.info, pi, Parameter(.5), sampling=False)
+
+    core = Core(agent, mdp)
+
+    # Train
+    core.learn(n_steps=100, n_steps_per_fit=1, quiet=True)
+
+    test_q = np.array([[5.04534862, 7.28125997, 5.61847561, 7.32156925],
+                       [3.30819962, 8.75, 5.46591451, 6.56295502],
+                       [5.50794185, 6.22590624, 7.37239172, 8.75],
+                       [0., 0., 0., 0.]])
+
+    assert np.allclose(agent.Q.table, test_q)
+
 
 def test_speedy_q_learning():
     pi, mdp, _ = initialize()
@@ -118,6 +225,16 @@ def test_speedy_q_learning():
 
     assert np.allclose(agent.Q.table, test_q)
 
+    pi, mdp, _ = initialize()
+    agent = SpeedyQLearning(mdp.info, pi, Parameter(.5), micro_batch=10)
+
+    core = Core(agent, mdp)
+
+    # Train
+    core.learn(n_steps=100, n_steps_per_fit=1, quiet=True)
+
+    assert np.allclose(agent.Q.table, test_q)
+
 
 def test_sarsa():
     pi, mdp, _ = initialize()
@@ -0,0 +1,22 @@
+import numpy as np
+
+from mushroom_rl.utils.table import Table
+
+
+def test_table_predict():
+    table = Table((3, 4))
+    table.table[:] = np.arange(12).reshape(3, 4)
+
+    states = np.array([[0], [1], [2]])
+
+    values = table.predict(states, np.array([[1], [2], [3]]))
+    assert np.array_equal(values, np.array([1, 6, 11]))
+
+    values = table.predict(states, np.array([1, 2, 3]))
+    assert np.array_equal(values, np.array([1, 6, 11]))
+
+    values = table.predict(np.array([1]), np.array([2]))
+    assert values == 6
+
+    values = table.predict(states)
+    assert np.array_equal(values, table.table)